@@ -15,34 +15,241 @@ limitations under the License.
 """
 
 import argparse
-import csv
 import os
+import sys
+import threading
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
+from importlib import resources
+from zoneinfo import TZPATH, ZoneInfo, available_timezones
 
-import pytz
+import requests
 import teslapy
 from dateutil.parser import parse
-from retry import retry
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+# Maximum number of API requests in flight at once.
+MAX_CONCURRENT_DOWNLOADS = 8
+
+# Number of days of power/soe data requested per API call.
+POWER_DOWNLOAD_CHUNK_DAYS = 7
+
+# Sustained API request rate (requests per second) and burst size.
+API_REQUEST_RATE = 2
+API_REQUEST_BURST = 5
+
+# How long to back off when rate limited without a usable Retry-After header.
+RATE_LIMIT_BACKOFF_SECONDS = 30
+
+# HTTP status codes worth retrying.
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Power CSV columns for the usual API response (after exclusions).
+POWER_FIELDNAMES = [
+    'timestamp',
+    'solar_power',
+    'battery_power',
+    'grid_power',
+    'load_power',
+]
+
+# Timezones to prefer when guessing a site's timezone from its UTC offset.
+US_TIMEZONES = (
+    'America/New_York',
+    'America/Chicago',
+    'America/Denver',
+    'America/Phoenix',
+    'America/Los_Angeles',
+    'America/Anchorage',
+    'Pacific/Honolulu',
+)
+
+# Write buffer size for CSV files.
+CSV_BUFFER_SIZE = 1 << 20
 
 # Exclude columns that are not relevant (and generally not set).
-EXCLUDED_COLUMNS = (
-    'grid_services_power',
-    'generator_power',
-    'generator_energy_exported',
-    'grid_services_energy_imported',
-    'grid_services_energy_exported',
-    'grid_energy_exported_from_generator',
-    'battery_energy_imported_from_generator',
-    'consumer_energy_imported_from_generator',
+EXCLUDED_COLUMNS = frozenset(
+    (
+        'grid_services_power',
+        'generator_power',
+        'generator_energy_exported',
+        'grid_services_energy_imported',
+        'grid_services_energy_exported',
+        'grid_energy_exported_from_generator',
+        'battery_energy_imported_from_generator',
+        'consumer_energy_imported_from_generator',
+    )
+)
+
+
+class RateLimiter:
+    """Token bucket shared by all download threads.
+
+    Requests only wait once the burst budget is used up, and a 429 response
+    drains the bucket for as long as the server asked us to back off.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(
+            self.burst, self.tokens + (now - self.last_refill) * self.rate
+        )
+        self.last_refill = now
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            # A negative balance means the token is reserved in the future.
+            deadline = now - min(self.tokens, 0) / self.rate
+        delay = deadline - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def backoff(self, seconds):
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.tokens, 0) - seconds * self.rate
+
+
+_rate_limiter = RateLimiter(API_REQUEST_RATE, API_REQUEST_BURST)
+
+
+def _get_retry_after(response):
+    try:
+        return float(response.headers['Retry-After'])
+    except (KeyError, ValueError):
+        return RATE_LIMIT_BACKOFF_SECONDS
+
+
+def _api(tesla, name, **kwargs):
+    _rate_limiter.acquire()
+    try:
+        return tesla.api(name, **kwargs)
+    except requests.HTTPError as e:
+        if e.response is not None and e.response.status_code == 429:
+            _rate_limiter.backoff(_get_retry_after(e.response))
+        raise
+
+
+def _is_transient_error(e):
+    if isinstance(e, (requests.ConnectionError, requests.Timeout)):
+        return True
+    response = getattr(e, 'response', None)
+    return response is not None and response.status_code in RETRY_STATUS_CODES
+
+
+# Retry network errors and throttling/server errors with exponential backoff;
+# anything else (e.g. a 404 or an empty response) fails right away.
+_retry_transient = retry(
+    stop=stop_after_attempt(5),
+    wait=wait_exponential_jitter(initial=1, max=30),
+    retry=retry_if_exception(_is_transient_error),
+    reraise=True,
 )
 
 
-def _remove_excluded_columns(timeseries):
-    for col in EXCLUDED_COLUMNS:
-        if col in timeseries:
-            del timeseries[col]
+def _configure_session(tesla):
+    # Keep teslapy's adapter class (it pins the TLS version), but size the
+    # connection pool so every download thread reuses a keep-alive connection.
+    # max_retries=2 retries connection errors for every request (as teslapy's
+    # retry=2 did), including token refreshes and PRODUCT_LIST.  It doesn't
+    # retry error statuses: those are left to _retry_transient, so they
+    # (including 429s for the rate limiter) come straight back as HTTPErrors.
+    adapter_class = type(tesla.get_adapter('https://'))
+    tesla.mount(
+        'https://',
+        adapter_class(pool_maxsize=MAX_CONCURRENT_DOWNLOADS, max_retries=2),
+    )
+
+
+def _download_concurrently(tasks):
+    """Run download tasks in a thread pool so that API round-trips overlap."""
+    executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DOWNLOADS)
+    try:
+        futures = [executor.submit(task) for task in tasks]
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception:
+                traceback.print_exc()
+    except BaseException:
+        # Don't wait for the queued downloads to finish (e.g. on Ctrl-C).
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+
+
+def _print_progress(csv_names):
+    # A single write, since print() writes the text and the newline separately
+    # and lines from concurrent downloads would get mixed up.
+    sys.stdout.write(''.join(f'  {os.path.basename(n)}\n' for n in csv_names))
+
+
+def _list_dir(dir):
+    # One directory listing is much cheaper than an exists() call per day.
+    try:
+        return {entry.name for entry in os.scandir(dir)}
+    except FileNotFoundError:
+        return set()
+
+
+def _format_timestamp(timestamp):
+    # API timestamps are ISO 8601 in local time (e.g. 2023-07-19T10:40:00-07:00),
+    # so the local date and time can be sliced out without parsing.
+    return f'{timestamp[:10]} {timestamp[11:19]}'
+
+
+def _get_fieldnames(timeseries):
+    # The timestamp always comes first, then the value columns in API order.
+    return ['timestamp'] + [
+        n for n in timeseries[0] if n != 'timestamp' and n not in EXCLUDED_COLUMNS
+    ]
+
+
+def _format_csv_row(values):
+    # Values are numbers and timestamps, so nothing needs quoting.  Rows end in
+    # \r\n like the csv module's default so existing downloads don't change.
+    return ','.join('' if v is None else str(v) for v in values) + '\r\n'
+
+
+def _write_csv_lines(csv_filename, lines):
+    os.makedirs(os.path.dirname(csv_filename), exist_ok=True)
+    data = ''.join(lines).encode('ascii')
+    with open(csv_filename, 'wb', buffering=CSV_BUFFER_SIZE) as csv_file:
+        csv_file.write(data)
+
+
+def _write_rows(timeseries, csv_filename, fieldnames, compute=None):
+    """Write a time series to CSV.
+
+    If compute is given, the last field is not read from the API data but
+    computed from each row with compute(ts).
+    """
+    columns = fieldnames[1:-1] if compute else fieldnames[1:]
+    lines = [_format_csv_row(fieldnames)]
+    for ts in timeseries:
+        values = [_format_timestamp(ts['timestamp'])]
+        values.extend(ts.get(n) for n in columns)
+        if compute:
+            values.append(compute(ts))
+        lines.append(_format_csv_row(values))
+    _write_csv_lines(csv_filename, lines)
 
 
 def _get_energy_csv_name(date, site_id, partial_month=False):
@@ -56,32 +263,37 @@ def _write_energy_csv(timeseries, date, site_id, partial_month=False):
         raise ValueError('No timeseries')
 
     csv_filename = _get_energy_csv_name(date, site_id, partial_month=partial_month)
-    os.makedirs(os.path.dirname(csv_filename), exist_ok=True)
-    fieldnames = list(timeseries[0].keys())
-    fieldnames = [n for n in fieldnames if n not in EXCLUDED_COLUMNS]
-    with open(csv_filename, 'w') as csv_file:
-        writer = csv.DictWriter(csv_file, fieldnames=fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        for ts in timeseries:
-            ts['timestamp'] = parse(ts['timestamp']).strftime('%Y-%m-%d %H:%M:%S')
-            _remove_excluded_columns(ts)
-            writer.writerow(ts)
-
-
-@retry(tries=2, delay=5)
-def _download_energy_month(
-    tesla, site_id, timezone, start_date, end_date, partial_month=False
-):
-    response = tesla.api(
+    _write_rows(timeseries, csv_filename, _get_fieldnames(timeseries))
+
+
+@_retry_transient
+def _get_calendar_history(tesla, site_id, tz, kind, period, start_date, end_date):
+    return _api(
+        tesla,
         'CALENDAR_HISTORY_DATA',
         path_vars={'site_id': site_id},
-        kind='energy',
-        period='month',
-        start_date=start_date.isoformat(),
-        end_date=end_date.isoformat(),
-        time_zone=timezone,
+        kind=kind,
+        period=period,
+        start_date=start_date,
+        end_date=end_date,
+        time_zone=tz.key,
     )['response']
 
+
+def _download_energy_month(
+    tesla, site_id, tz, start_date, end_date, partial_month=False
+):
+    _print_progress([_get_energy_csv_name(start_date, site_id)])
+    response = _get_calendar_history(
+        tesla,
+        site_id,
+        tz,
+        'energy',
+        'month',
+        start_date.isoformat(),
+        end_date.isoformat(),
+    )
+
     if not response or 'time_series' not in response:
         raise ValueError(f'No timeseries for {start_date}')
     _write_energy_csv(
@@ -89,27 +301,73 @@ def _download_energy_month(
     )
 
 
+def _read_zone_tab(zone_tab):
+    # Lines are "country code, coordinates, TZ name[, comments]", tab separated.
+    timezones = []
+    for line in zone_tab:
+        fields = line.split('\t')
+        if not line.startswith('#') and len(fields) >= 3 and fields[2].strip():
+            timezones.append(fields[2].strip())
+    return timezones
+
+
+def _get_canonical_timezones():
+    # zone.tab lists the canonical zones for each country, without backward
+    # compatible links like Asia/Calcutta.  It ships with both the system
+    # timezone database and the tzdata package.
+    for path in TZPATH:
+        try:
+            with open(os.path.join(path, 'zone.tab')) as zone_tab:
+                return _read_zone_tab(zone_tab)
+        except OSError:
+            pass
+    try:
+        with resources.files('tzdata.zoneinfo').joinpath('zone.tab').open() as zone_tab:
+            return _read_zone_tab(zone_tab)
+    except (ImportError, OSError):
+        return []
+
+
+@lru_cache(maxsize=None)
+def _get_offset_timezones():
+    # Current UTC offset (e.g. -0700) to timezone name, preferring US timezones,
+    # then canonical ones, then any other Area/Location name, and only then
+    # Etc/* and bare aliases.  Built once since it formats ~600 timezones.
+    now = datetime.now().astimezone()
+    offset_timezones = {}
+    for timezones in (
+        US_TIMEZONES,
+        sorted(_get_canonical_timezones()),
+        sorted(
+            tz
+            for tz in available_timezones()
+            if '/' in tz and not tz.startswith('Etc/')
+        ),
+        sorted(available_timezones()),
+    ):
+        for tz in timezones:
+            offset = now.astimezone(ZoneInfo(tz)).strftime('%z')
+            offset_timezones.setdefault(offset, tz)
+    return offset_timezones
+
+
 def _get_timezone(site_config, installation_date):
     if 'installation_time_zone' in site_config:
         return site_config['installation_time_zone']
-    offset = installation_date.strftime('%z')
-    for tz in pytz.country_timezones('us'):
-        if datetime.now(pytz.timezone(tz)).strftime('%z') == offset:
-            return tz
-    for tz in pytz.common_timezones:
-        if datetime.now(pytz.timezone(tz)).strftime('%z') == offset:
-            return tz
-    for tz in pytz.all_timezones:
-        if datetime.now(pytz.timezone(tz)).strftime('%z') == offset:
-            return tz
-
-
-def _download_energy_data(tesla, site_id, debug=False):
-    site_config = tesla.api('SITE_CONFIG', path_vars={'site_id': site_id})['response']
+    return _get_offset_timezones().get(installation_date.strftime('%z'))
+
+
+@_retry_transient
+def _get_site_info(tesla, site_id):
+    site_config = _api(tesla, 'SITE_CONFIG', path_vars={'site_id': site_id})['response']
     installation_date = parse(site_config['installation_date'])
-    timezone = _get_timezone(site_config, installation_date)
+    return installation_date, _get_timezone(site_config, installation_date)
+
+
+def _download_energy_data(tesla, site_id, installation_date, timezone, debug=False):
+    tz = ZoneInfo(timezone)
 
-    now = datetime.now(pytz.timezone(timezone)).replace(microsecond=0)
+    now = datetime.now(tz).replace(microsecond=0)
     start_date = now.replace(hour=0, minute=0, second=0)
     end_date = now.replace(hour=23, minute=59, second=59)
 
@@ -122,30 +380,30 @@ def _download_energy_data(tesla, site_id, debug=False):
     # The latest month will be partial.
     partial_month = True
 
+    existing = _list_dir(os.path.join('download', str(site_id), 'energy'))
+
+    tasks = []
     while end_date > installation_date:
         csv_name = _get_energy_csv_name(start_date, site_id)
-        if partial_month or not os.path.exists(
-            _get_energy_csv_name(start_date, site_id)
-        ):
-            print(f'  {os.path.basename(csv_name)}')
-            try:
-                _download_energy_month(
+        if partial_month or os.path.basename(csv_name) not in existing:
+            tasks.append(
+                partial(
+                    _download_energy_month,
                     tesla,
                     site_id,
-                    timezone,
+                    tz,
                     start_date,
                     end_date,
                     partial_month=partial_month,
                 )
-            except Exception:
-                traceback.print_exc()
-            time.sleep(1)
+            )
         partial_month = False
         end_date = start_date - timedelta(seconds=1)
         start_date = end_date.replace(hour=0, minute=0, second=0) - timedelta(
             days=end_date.day - 1
         )
-        start_date = pytz.timezone(timezone).localize(start_date.replace(tzinfo=None))
+
+    _download_concurrently(tasks)
 
 
 def _delete_partial_energy_files(site_id):
@@ -169,27 +427,33 @@ def _get_soe_csv_name(date, site_id, partial_day=False):
     return f'download/{site_id}/soe/{str_date}{suffix}'
 
 
+def _load_power(ts):
+    return (
+        ts['solar_power']
+        + ts['battery_power']
+        + ts['grid_power']
+        + ts['generator_power']
+    )
+
+
 def _write_power_csv(timeseries, date, site_id, partial_day=False):
     if not timeseries:
         raise ValueError(f'No timeseries for {date}')
 
     csv_filename = _get_power_csv_name(date, site_id, partial_day=partial_day)
-    os.makedirs(os.path.dirname(csv_filename), exist_ok=True)
-    fieldnames = list(timeseries[0].keys()) + ['load_power']
-    fieldnames = [n for n in fieldnames if n not in EXCLUDED_COLUMNS]
-    with open(csv_filename, 'w') as csv_file:
-        writer = csv.DictWriter(csv_file, fieldnames=fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        for ts in timeseries:
-            ts['timestamp'] = parse(ts['timestamp']).strftime('%Y-%m-%d %H:%M:%S')
-            ts['load_power'] = (
-                ts['solar_power']
-                + ts['battery_power']
-                + ts['grid_power']
-                + ts['generator_power']
-            )
-            _remove_excluded_columns(ts)
-            writer.writerow(ts)
+    fieldnames = _get_fieldnames(timeseries) + ['load_power']
+    if fieldnames == POWER_FIELDNAMES:
+        # Fast path for the usual schema: format each row with a fixed template.
+        lines = [_format_csv_row(fieldnames)]
+        lines.extend(
+            f"{ts['timestamp'][:10]} {ts['timestamp'][11:19]},"
+            f"{ts['solar_power']},{ts['battery_power']},{ts['grid_power']},"
+            f"{_load_power(ts)}\r\n"
+            for ts in timeseries
+        )
+        _write_csv_lines(csv_filename, lines)
+    else:
+        _write_rows(timeseries, csv_filename, fieldnames, compute=_load_power)
 
 
 def _write_soe_csv(timeseries, date, site_id, partial_day=False):
@@ -197,101 +461,133 @@ def _write_soe_csv(timeseries, date, site_id, partial_day=False):
         raise ValueError(f'No timeseries for {date}')
 
     csv_filename = _get_soe_csv_name(date, site_id, partial_day=partial_day)
-    os.makedirs(os.path.dirname(csv_filename), exist_ok=True)
-    fieldnames = list(timeseries[0].keys())
-    fieldnames = [n for n in fieldnames if n not in EXCLUDED_COLUMNS]
-    with open(csv_filename, 'w') as csv_file:
-        writer = csv.DictWriter(csv_file, fieldnames=fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        for ts in timeseries:
-            ts['timestamp'] = parse(ts['timestamp']).strftime('%Y-%m-%d %H:%M:%S')
-            _remove_excluded_columns(ts)
-            writer.writerow(ts)
-
-
-@retry(tries=2, delay=5)
-def _download_power_day(tesla, site_id, timezone, date, partial_day=True):
-    start_date = (
-        pytz.timezone(timezone)
-        .localize(date.replace(hour=0, minute=0, second=0, tzinfo=None))
-        .isoformat()
-    )
-    end_date = (
-        pytz.timezone(timezone)
-        .localize(date.replace(hour=23, minute=59, second=59, tzinfo=None))
-        .isoformat()
+    _write_rows(timeseries, csv_filename, _get_fieldnames(timeseries))
+
+
+def _download_power_day(
+    tesla, site_id, tz, date, start_date, end_date, partial_day=True
+):
+    response = _get_calendar_history(
+        tesla, site_id, tz, 'power', 'day', start_date, end_date
     )
-    response = tesla.api(
-        'CALENDAR_HISTORY_DATA',
-        path_vars={'site_id': site_id},
-        kind='power',
-        period='day',
-        start_date=start_date,
-        end_date=end_date,
-        time_zone=timezone,
-    )['response']
 
     if not response or 'time_series' not in response:
         raise ValueError(f'No timeseries for {date}')
     _write_power_csv(response['time_series'], date, site_id, partial_day=partial_day)
 
 
-@retry(tries=2, delay=5)
-def _download_soe_day(tesla, site_id, timezone, date, partial_day=True):
-    start_date = (
-        pytz.timezone(timezone)
-        .localize(date.replace(hour=0, minute=0, second=0, tzinfo=None))
-        .isoformat()
-    )
-    end_date = (
-        pytz.timezone(timezone)
-        .localize(date.replace(hour=23, minute=59, second=59, tzinfo=None))
-        .isoformat()
+def _download_soe_day(tesla, site_id, tz, date, start_date, end_date, partial_day=True):
+    response = _get_calendar_history(
+        tesla, site_id, tz, 'soe', 'day', start_date, end_date
     )
-    response = tesla.api(
-        'CALENDAR_HISTORY_DATA',
-        path_vars={'site_id': site_id},
-        kind='soe',
-        period='day',
-        start_date=start_date,
-        end_date=end_date,
-        time_zone=timezone,
-    )['response']
 
     if response and 'time_series' in response:
         _write_soe_csv(response['time_series'], date, site_id, partial_day=partial_day)
 
 
-def _download_power_data(tesla, site_id, debug=False):
-    site_config = tesla.api('SITE_CONFIG', path_vars={'site_id': site_id})['response']
-    installation_date = parse(site_config['installation_date'])
-    timezone = _get_timezone(site_config, installation_date)
+def _get_date_range(tz, start, end):
+    """ISO start/end of the range from midnight of start to the end of the end day."""
+    start_date = start.replace(hour=0, minute=0, second=0, tzinfo=tz)
+    end_date = end.replace(hour=23, minute=59, second=59, tzinfo=tz)
+    return start_date.isoformat(), end_date.isoformat()
 
-    date = datetime.now(pytz.timezone(timezone)).replace(
-        hour=0, minute=0, second=0, microsecond=0
+
+def _download_range(tesla, site_id, tz, kind, start_date, end_date):
+    """Returns the time series partitioned by (local) day, keyed by YYYY-MM-DD."""
+    response = _get_calendar_history(
+        tesla, site_id, tz, kind, 'day', start_date, end_date
+    )
+
+    timeseries_by_day = {}
+    if response and 'time_series' in response:
+        for ts in response['time_series']:
+            timeseries_by_day.setdefault(ts['timestamp'][:10], []).append(ts)
+    return timeseries_by_day
+
+
+def _download_power_days(tesla, site_id, tz, dates):
+    """Download full days of power and soe data, two API calls for all dates.
+
+    dates must be consecutive days, newest first.
+    """
+    _print_progress([_get_power_csv_name(date, site_id) for date in dates])
+    start_date, end_date = _get_date_range(tz, dates[-1], dates[0])
+
+    # Write the power CSVs before requesting soe data so that a failed soe
+    # request doesn't lose them.
+    power = _download_range(tesla, site_id, tz, 'power', start_date, end_date)
+    missing = []
+    for date in dates:
+        day = date.strftime('%Y-%m-%d')
+        if day in power:
+            _write_power_csv(power[day], date, site_id)
+        else:
+            missing.append(day)
+
+    soe = _download_range(tesla, site_id, tz, 'soe', start_date, end_date)
+    for date in dates:
+        day = date.strftime('%Y-%m-%d')
+        if day in power and day in soe:
+            _write_soe_csv(soe[day], date, site_id)
+    if missing:
+        raise ValueError(f'No timeseries for {", ".join(missing)}')
+
+
+def _download_power_and_soe_day(tesla, site_id, tz, date, partial_day=True):
+    _print_progress([_get_power_csv_name(date, site_id)])
+    start_date, end_date = _get_date_range(tz, date, date)
+    _download_power_day(
+        tesla, site_id, tz, date, start_date, end_date, partial_day=partial_day
     )
+    _download_soe_day(
+        tesla, site_id, tz, date, start_date, end_date, partial_day=partial_day
+    )
+
+
+def _get_missing_power_dates(site_id, today, installation_date):
+    """Full days without a power CSV, from yesterday back to the installation date."""
+    existing = _list_dir(os.path.join('download', str(site_id), 'power'))
+    dates = []
+    # Aware datetime arithmetic is wall-clock time with zoneinfo, so this stays
+    # at midnight (with the right UTC offset) across daylight saving changes.
+    date = today - timedelta(days=1)
+    while date > installation_date:
+        if os.path.basename(_get_power_csv_name(date, site_id)) not in existing:
+            dates.append(date)
+        date -= timedelta(days=1)
+    return dates
+
+
+def _download_power_data(tesla, site_id, installation_date, timezone, debug=False):
+    tz = ZoneInfo(timezone)
+
+    today = datetime.now(tz).replace(hour=0, minute=0, second=0, microsecond=0)
     if debug:
         print(f'Timezone: {timezone}')
-        print(f'Start date: {date}')
+        print(f'Start date: {today}')
 
+    tasks = []
     # The first day (today) will be partial.
-    partial_day = True
+    if today > installation_date:
+        tasks.append(
+            partial(
+                _download_power_and_soe_day, tesla, site_id, tz, today, partial_day=True
+            )
+        )
 
-    while date > installation_date:
-        csv_name = _get_power_csv_name(date, site_id)
-        if partial_day or not os.path.exists(csv_name):
-            print(f'  {os.path.basename(csv_name)}')
-            try:
-                _download_power_day(tesla, site_id, timezone, date, partial_day=partial_day)
-                _download_soe_day(tesla, site_id, timezone, date, partial_day=partial_day)
-            except Exception:
-                traceback.print_exc()
-            time.sleep(1)
-        date -= timedelta(days=1)
-        partial_day = False
-        # Re-localize the date based on the timezone.  This is important because we maybe have
-        # crossed a daylight saving change so the timezone offset will be different.
-        date = pytz.timezone(timezone).localize(date.replace(tzinfo=None))
+    # Runs of consecutive missing days, downloaded with one API call per run.
+    runs = []
+    for date in _get_missing_power_dates(site_id, today, installation_date):
+        if (
+            not runs
+            or len(runs[-1]) == POWER_DOWNLOAD_CHUNK_DAYS
+            or runs[-1][-1] - date != timedelta(days=1)
+        ):
+            runs.append([])
+        runs[-1].append(date)
+    tasks.extend(partial(_download_power_days, tesla, site_id, tz, run) for run in runs)
+
+    _download_concurrently(tasks)
 
 
 def _delete_partial_power_files(site_id):
@@ -322,7 +618,8 @@ def main():
     parser.add_argument('--debug', action='store_true', help='Print debug info')
     args = parser.parse_args()
 
-    tesla = teslapy.Tesla(args.email, retry=2, timeout=10)
+    tesla = teslapy.Tesla(args.email, timeout=10)
+    _configure_session(tesla)
     if not tesla.authorized:
         print('STEP 1: Log in to Tesla.  Open this page in your browser:\n')
         print(tesla.authorization_url())
@@ -339,12 +636,20 @@ def main():
         if resource_type in ('battery', 'solar'):
             site_id = product['energy_site_id']
             obfuscated_site_it = f'***{str(site_id)[-4:]}'
+            try:
+                installation_date, timezone = _get_site_info(tesla, site_id)
+            except Exception:
+                traceback.print_exc()
+                continue
+
             print(
                 f'Downloading energy data for {resource_type} site {obfuscated_site_it} to download/energy/'
             )
             try:
                 _delete_partial_energy_files(site_id)
-                _download_energy_data(tesla, site_id, debug=args.debug)
+                _download_energy_data(
+                    tesla, site_id, installation_date, timezone, debug=args.debug
+                )
             except Exception:
                 traceback.print_exc()
             print()
@@ -355,7 +660,9 @@ def main():
             try:
                 _delete_partial_power_files(site_id)
                 _delete_partial_soe_files(site_id)
-                _download_power_data(tesla, site_id, debug=args.debug)
+                _download_power_data(
+                    tesla, site_id, installation_date, timezone, debug=args.debug
+                )
             except Exception:
                 traceback.print_exc()
 